@@ -1,16 +1,21 @@
 """Event processor with atomic claiming for exactly-once processing."""
 
+import random
 import time
-from datetime import datetime, timedelta
+from datetime import datetime
 from typing import Optional, Dict, Any
 from sqlalchemy.orm import Session
-from sqlalchemy import text
+from sqlalchemy import func, select, text
 import structlog
 
 from database.models import Event
 
 logger = structlog.get_logger(__name__)
 
+# Retry backoff bounds (seconds) for failed events
+RETRY_BACKOFF_BASE = 10
+RETRY_BACKOFF_CAP = 300
+
 
 class EventProcessor:
     """Processes events with exactly-once semantics using PostgreSQL-backed claiming."""
@@ -42,6 +47,20 @@ class EventProcessor:
             max_retry_count=max_retry_count,
         )
 
+    def bind(self, session: Session) -> "EventProcessor":
+        """Attach a database session for subsequent operations.
+
+        Lets a long-lived processor be reused across short-lived sessions.
+
+        Args:
+            session: Database session
+
+        Returns:
+            This processor
+        """
+        self.session = session
+        return self
+
     def claim_event(self) -> Optional[Event]:
         """Atomically claim a pending event for processing.
 
@@ -61,7 +80,8 @@ class EventProcessor:
                     visibility_timeout = NOW() + INTERVAL ':timeout seconds'
                 WHERE id = (
                     SELECT id FROM events
-                    WHERE (status = 'pending' OR (status = 'processing' AND visibility_timeout < NOW()))
+                    WHERE ((status = 'pending' AND (visibility_timeout IS NULL OR visibility_timeout <= NOW()))
+                           OR (status = 'processing' AND visibility_timeout < NOW()))
                       AND retry_count < :max_retry_count
                     ORDER BY created_at ASC
                     LIMIT 1
@@ -71,22 +91,18 @@ class EventProcessor:
             """
             )
 
-            result = self.session.execute(
-                query,
+            # Hydrate the Event directly from RETURNING instead of re-selecting it by id
+            event = self.session.scalars(
+                select(Event).from_statement(query),
                 {
                     "worker_id": self.worker_id,
                     "timeout": self.visibility_timeout,
                     "max_retry_count": self.max_retry_count,
                 },
-            )
+            ).first()
 
-            row = result.fetchone()
-
-            if row:
-                # Convert row to Event object
-                event = self.session.query(Event).filter(Event.id == row.id).first()
-
-                logger.info(
+            if event:
+                logger.debug(
                     "event_claimed",
                     event_id=event.id,
                     event_type=event.event_type,
@@ -124,7 +140,7 @@ class EventProcessor:
             event.visibility_timeout = None
             self.session.commit()
 
-            logger.info(
+            logger.debug(
                 "event_completed",
                 event_id=event.id,
                 event_type=event.event_type,
@@ -174,10 +190,14 @@ class EventProcessor:
                     error=error_message,
                 )
             else:
-                # Set back to pending with exponential backoff visibility timeout
+                # Set back to pending with a jittered backoff visibility timeout. The
+                # deadline is computed by the database so it is compared against the
+                # same clock (and timezone) as NOW() in claim_event.
                 event.status = "pending"
-                backoff_seconds = min(300, 2 ** event.retry_count * 10)  # Max 5 minutes
-                event.visibility_timeout = datetime.utcnow() + timedelta(seconds=backoff_seconds)
+                backoff_seconds = self._retry_backoff(event.retry_count)
+                event.visibility_timeout = func.now() + func.make_interval(
+                    0, 0, 0, 0, 0, 0, backoff_seconds
+                )
 
                 logger.warning(
                     "event_failed_will_retry",
@@ -185,7 +205,7 @@ class EventProcessor:
                     event_type=event.event_type,
                     worker_id=self.worker_id,
                     retry_count=event.retry_count,
-                    next_retry_at=event.visibility_timeout.isoformat(),
+                    retry_in_seconds=round(backoff_seconds, 1),
                     error=error_message,
                 )
 
@@ -202,6 +222,23 @@ class EventProcessor:
             )
             return False
 
+    @staticmethod
+    def _retry_backoff(retry_count: int) -> float:
+        """Compute a jittered retry delay.
+
+        Draws uniformly between the base delay and an upper bound that grows
+        exponentially with retry_count (capped uniform jitter), so events that
+        failed together do not all become visible again at the same instant.
+
+        Args:
+            retry_count: Number of retries already attempted
+
+        Returns:
+            Backoff delay in seconds (capped at RETRY_BACKOFF_CAP)
+        """
+        upper = min(RETRY_BACKOFF_CAP, RETRY_BACKOFF_BASE * 3 ** retry_count)
+        return random.uniform(RETRY_BACKOFF_BASE, upper)
+
     def insert_event(self, event_type: str, payload: Dict[str, Any]) -> Optional[int]:
         """Insert a new event into the queue.
 
@@ -222,7 +259,7 @@ class EventProcessor:
             self.session.add(event)
             self.session.commit()
 
-            logger.info(
+            logger.debug(
                 "event_inserted",
                 event_id=event.id,
                 event_type=event_type,
@@ -249,7 +286,7 @@ class EventProcessor:
             Event if found, None otherwise
         """
         try:
-            return self.session.query(Event).filter(Event.id == event_id).first()
+            return self.session.get(Event, event_id)
         except Exception as e:
             logger.error(
                 "event_retrieval_failed",
@@ -1,5 +1,7 @@
 """Worker pool with bounded concurrency for agent processing."""
 
+import select
+import socket
 import threading
 import time
 import signal
@@ -13,6 +15,9 @@ from database.connection import DatabaseConnection
 
 logger = structlog.get_logger(__name__)
 
+# Per-event logs are DEBUG; emit an INFO progress line every N processed events
+LOG_SAMPLE_EVERY = 100
+
 
 @dataclass
 class WorkerStats:
@@ -52,6 +57,9 @@ class Worker(threading.Thread):
         self._stop_event = threading.Event()
         self.stats = WorkerStats(worker_id=worker_id)
 
+        # Built from the first session; later iterations only rebind a fresh session
+        self.processor: Optional[EventProcessor] = None
+
         logger.info("worker_initialized", worker_id=worker_id)
 
     def run(self):
@@ -63,7 +71,9 @@ class Worker(threading.Thread):
             try:
                 # Get a new database session for this iteration
                 with self.db_connection.session() as session:
-                    processor = EventProcessor(session, worker_id=self.worker_id)
+                    if self.processor is None:
+                        self.processor = EventProcessor(session, worker_id=self.worker_id)
+                    processor = self.processor.bind(session)
 
                     # Try to claim an event
                     event = processor.claim_event()
@@ -73,8 +83,8 @@ class Worker(threading.Thread):
                         self.stats.last_event_at = time.time()
                         self._process_event(event, processor)
                     else:
-                        # No events available, wait before polling again
-                        time.sleep(self.poll_interval)
+                        # No events available, wait before polling again (wakes early on stop)
+                        self._stop_event.wait(self.poll_interval)
 
             except Exception as e:
                 logger.error(
@@ -82,7 +92,7 @@ class Worker(threading.Thread):
                     worker_id=self.worker_id,
                     error=str(e),
                 )
-                time.sleep(self.poll_interval)
+                self._stop_event.wait(self.poll_interval)
 
         self.stats.is_running = False
         logger.info(
@@ -99,10 +109,10 @@ class Worker(threading.Thread):
             event: Event to process
             processor: Event processor for updating status
         """
-        start_time = time.time()
+        start_time = time.monotonic()
 
         try:
-            logger.info(
+            logger.debug(
                 "event_processing_started",
                 worker_id=self.worker_id,
                 event_id=event.id,
@@ -116,8 +126,8 @@ class Worker(threading.Thread):
             processor.complete_event(event)
             self.stats.events_processed += 1
 
-            duration = time.time() - start_time
-            logger.info(
+            duration = time.monotonic() - start_time
+            logger.debug(
                 "event_processing_completed",
                 worker_id=self.worker_id,
                 event_id=event.id,
@@ -125,13 +135,21 @@ class Worker(threading.Thread):
                 duration=duration,
             )
 
+            if self.stats.events_processed % LOG_SAMPLE_EVERY == 0:
+                logger.info(
+                    "worker_progress",
+                    worker_id=self.worker_id,
+                    events_processed=self.stats.events_processed,
+                    events_failed=self.stats.events_failed,
+                )
+
         except Exception as e:
             # Mark as failed
             error_message = f"{type(e).__name__}: {str(e)}"
             processor.fail_event(event, error_message)
             self.stats.events_failed += 1
 
-            duration = time.time() - start_time
+            duration = time.monotonic() - start_time
             logger.error(
                 "event_processing_failed",
                 worker_id=self.worker_id,
@@ -192,11 +210,7 @@ class WorkerPool:
         self.poll_interval = poll_interval
 
         self.workers = []
-        self._shutdown_requested = False
-
-        # Register signal handlers for graceful shutdown
-        signal.signal(signal.SIGINT, self._signal_handler)
-        signal.signal(signal.SIGTERM, self._signal_handler)
+        self._shutdown_signal: Optional[int] = None
 
         logger.info("worker_pool_initialized", pool_size=size)
 
@@ -236,9 +250,9 @@ class WorkerPool:
             worker.stop()
 
         # Wait for all workers to finish
-        start_time = time.time()
+        deadline = time.monotonic() + timeout
         for worker in self.workers:
-            remaining_time = max(0, timeout - (time.time() - start_time))
+            remaining_time = max(0, deadline - time.monotonic())
             worker.join(timeout=remaining_time)
 
             if worker.is_alive():
@@ -287,32 +301,59 @@ class WorkerPool:
         return all(worker.is_healthy() for worker in self.workers)
 
     def _signal_handler(self, signum, frame):
-        """Handle shutdown signals."""
-        signal_name = signal.Signals(signum).name
-        logger.info("shutdown_signal_received", signal=signal_name)
+        """Handle shutdown signals.
 
-        if not self._shutdown_requested:
-            self._shutdown_requested = True
-            self.stop()
+        Only records the signal number: no locks, logging or I/O happen in
+        signal context. run_forever is woken through the wakeup fd and does
+        the logging and teardown.
+        """
+        self._shutdown_signal = signum
 
     def run_forever(self):
         """Run the worker pool until shutdown is requested.
 
-        This method blocks until a shutdown signal is received.
+        This method blocks until SIGINT or SIGTERM is received. The signal
+        handlers are only installed for the duration of this call (which must
+        run on the main thread), so callers that only use start()/stop() keep
+        the default signal behaviour.
         """
         logger.info("worker_pool_running")
 
-        try:
-            while not self._shutdown_requested:
-                time.sleep(1)
+        # The C-level handler writes to this socket, so select() returns as
+        # soon as a signal arrives instead of after its timeout.
+        wakeup_reader, wakeup_writer = socket.socketpair()
+        wakeup_reader.setblocking(False)
+        wakeup_writer.setblocking(False)
+        previous_wakeup_fd = signal.set_wakeup_fd(wakeup_writer.fileno())
+        previous_handlers = {
+            signum: signal.signal(signum, self._signal_handler)
+            for signum in (signal.SIGINT, signal.SIGTERM)
+        }
 
-                # Periodically log statistics
-                if int(time.time()) % 60 == 0:  # Every minute
-                    stats = self.get_stats()
-                    logger.info("worker_pool_stats", **stats)
+        try:
+            # Wake once a minute to log statistics
+            while self._shutdown_signal is None:
+                ready, _, _ = select.select([wakeup_reader], [], [], 60)
+                if ready:
+                    try:
+                        wakeup_reader.recv(4096)
+                    except BlockingIOError:
+                        pass
+                    continue
+
+                stats = self.get_stats()
+                logger.info("worker_pool_stats", **stats)
+
+            signal_name = signal.Signals(self._shutdown_signal).name
+            logger.info("shutdown_signal_received", signal=signal_name)
 
         except KeyboardInterrupt:
             logger.info("keyboard_interrupt_received")
 
         finally:
+            for signum, handler in previous_handlers.items():
+                signal.signal(signum, handler)
+            signal.set_wakeup_fd(previous_wakeup_fd)
+            wakeup_reader.close()
+            wakeup_writer.close()
             self.stop()